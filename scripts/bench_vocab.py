@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Benchmarks for the vocabulary build - run `python bench_vocab.py <benchmark>`"""
+import argparse, importlib, json, os, random, subprocess, sys, time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+def _memory_child(layout):
+    """Load and merge the word bank in one layout and print its footprint as JSON"""
+    import generate_vocab as g
+    before = g.peak_memory_mb()
+    if layout == "tuple":
+        sources = []
+        for module_name, attr, _ in g.SOURCE_REGISTRY:
+            sources.append((module_name, getattr(importlib.import_module(module_name), attr)))
+    else:
+        sources = g.load_sources()
+    words = g.merge_sources(sources)[0]
+    rows = [w for cat_words in words.values() for w in cat_words]
+    strings = [w[0] for w in rows] + [w[1] for w in rows] + [m for w in rows for m in w[2]]
+    print(json.dumps({
+        "layout": layout,
+        "rows": len(rows),
+        "peak_rss_mb": g.peak_memory_mb(),
+        "load_rss_mb": g.peak_memory_mb() - before,
+        "str_refs": len(strings),
+        "distinct_str_objects": len({id(s) for s in strings}),
+    }))
+
+def bench_memory(args):
+    """Compare peak RSS of the raw tuple layout against interned WordEntry rows"""
+    results = []
+    for layout in ("tuple", "entry"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "memory", "--layout", layout],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    print(f"{'layout':<8} {'rows':>6} {'peak RSS':>12} {'load delta':>12} {'str objects':>12}")
+    for r in results:
+        print(f"{r['layout']:<8} {r['rows']:>6} {r['peak_rss_mb']:>8.2f} MiB {r['load_rss_mb']:>8.2f} MiB "
+              f"{r['distinct_str_objects']:>5}/{r['str_refs']}")
+    tuple_mb, entry_mb = results[0]["peak_rss_mb"], results[1]["peak_rss_mb"]
+    print(f"Peak RSS change: {entry_mb - tuple_mb:+.2f} MiB ({(entry_mb - tuple_mb) / tuple_mb * 100:+.1f}%)")
+
+def bench_phonetics(args):
+    """Words per second of per-word vs batched eng_to_ipa lookups, and of the bundled pronunciation table"""
+    import generate_vocab as g
+    if not g.HAS_IPA:
+        sys.exit("eng_to_ipa is not installed; only the bundled table path would run")
+    table = g.load_words()
+    words = list(dict.fromkeys(table.words))[:args.limit]
+    chunk = args.chunk or g.PHONETIC_CHUNK
+
+    start = time.perf_counter()
+    per_word = {w: g.get_kk_phonetic(w, table={}) for w in words}
+    per_word_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = g.transcribe_batch(words, chunk, table={})
+    batched_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bundled = g.transcribe_batch(words, chunk)
+    bundled_s = time.perf_counter() - start
+
+    mismatches = [w for w in words if per_word[w] != batched[w]]
+    differ = sum(1 for w in words if bundled[w] != batched[w])
+    print(f"{'path':<10} {'words':>6} {'seconds':>8} {'words/s':>11}")
+    for name, seconds in (("per-word", per_word_s), ("batched", batched_s), ("table", bundled_s)):
+        print(f"{name:<10} {len(words):>6} {seconds:>8.3f} {len(words) / seconds:>11,.0f}")
+    print(f"Speedup: {per_word_s / batched_s:.1f}x with chunks of {chunk}; "
+          f"{len(mismatches)} mismatches{': ' + ', '.join(mismatches[:10]) if mismatches else ''}; "
+          f"bundled table differs from eng_to_ipa on {differ} words")
+
+def _best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_templates(args):
+    """Per-sentence cost of the per-word sentence API, the batch API and the bare template fill"""
+    import generate_vocab as g
+    from templates import SENTENCE_BANK
+    table = g.load_words()
+    words = table.rows(range(len(table)))
+    id_keys = [w[0] for w in words]
+    n = 2 * len(words)
+
+    def per_word():
+        for i, w in enumerate(words):
+            g.generate_sentence(w, i)
+            g.generate_sentence_2(w, i)
+
+    def fmt():
+        for i, w in enumerate(words):
+            en, zh = SENTENCE_BANK.pick(w[1], i)
+            en.text.format(word=w[0])
+            zh.text.format(word=w[2][0])
+
+    def fill():
+        for i, w in enumerate(words):
+            en, zh = SENTENCE_BANK.pick(w[1], i)
+            en.fill(w[0])
+            zh.fill(w[2][0])
+
+    assert g.render_sentences(words, id_keys) == [s for i, w in enumerate(words)
+                                                  for s in (g.generate_sentence(w, i), g.generate_sentence_2(w, i))]
+    print(f"{'path':<22} {'sentences':>9} {'us/sentence':>12}")
+    for name, fn, count in (("per-word API", per_word, n),
+                            ("render_sentences", lambda: g.render_sentences(words, id_keys), n),
+                            ("str.format (en+zh)", fmt, len(words)),
+                            ("Template.fill (en+zh)", fill, len(words))):
+        seconds = _best_of(args.repeat, fn)
+        print(f"{name:<22} {count:>9} {seconds / count * 1e6:>12.2f}")
+
+def _synthetic_category(rows, size):
+    """size rows cycled from the bank, with copies renamed so every word is distinct"""
+    out = []
+    for i in range(size):
+        w = rows[i % len(rows)]
+        copy = i // len(rows)
+        out.append(w if copy == 0 else (f"{w[0]}{copy}", w[1], w[2], w[3].replace(w[0], f"{w[0]}{copy}"), w[4]))
+    return out
+
+def _scan_distractors(rows, word, pos, k=3):
+    # The previous selection: filter the whole category for every question
+    same_pos = [w for w in rows if w[1] == pos and w[0] != word]
+    if len(same_pos) < k:
+        same_pos = [w for w in rows if w[0] != word]
+    return random.sample(same_pos, min(k, len(same_pos)))
+
+def bench_questions(args):
+    """Per-question cost of distractor selection by category scan vs the POS bucket index, as categories grow"""
+    import generate_vocab as g
+    from distractors import DistractorIndex
+    table = g.load_words()
+    bank = table.rows(range(len(table)))
+    print(f"{'category':>8} {'scan us/q':>10} {'index us/q':>11} {'questions us/q':>15}")
+    for size in args.sizes:
+        rows = _synthetic_category(bank, size)
+        n = g.QUESTIONS_PER_WORD * size
+        index = DistractorIndex(rows)
+        random.seed(0)
+        scanned = [_scan_distractors(rows, w[0], w[1]) for w in rows]
+        random.seed(0)
+        assert [index.sample(w[0], w[1]) for w in rows] == scanned
+
+        def scan():
+            for w in rows:
+                for _ in range(g.QUESTIONS_PER_WORD):
+                    _scan_distractors(rows, w[0], w[1])
+
+        def indexed():
+            index = DistractorIndex(rows)
+            for w in rows:
+                for _ in range(g.QUESTIONS_PER_WORD):
+                    index.sample(w[0], w[1])
+
+        def questions():
+            index = DistractorIndex(rows)
+            for w in rows:
+                for qi in range(g.QUESTIONS_PER_WORD):
+                    g.generate_question(w, index, qi)
+
+        # The scan is quadratic, so it is timed once
+        cells = [_best_of(1, scan), _best_of(args.repeat, indexed), _best_of(args.repeat, questions)]
+        print(f"{size:>8} " + " ".join(f"{seconds / n * 1e6:>{width}.2f}" for seconds, width in zip(cells, (10, 11, 15))))
+
+def bench_pool(args):
+    """Build time and per-draw cost of the weighted global distractor pool as the vocabulary grows"""
+    import generate_vocab as g
+    from distractors import WeightedPool
+    table = g.load_words()
+    bank = table.rows(range(len(table)))
+    bank_categories = [table.categories[c] for c in table.category]
+    queries = [(w[0], w[1], cat_id, w[4]) for w, cat_id in zip(bank, bank_categories)]
+    rng = random.Random(0)
+    print(f"{'words':>8} {'strata':>7} {'build ms':>9} {'tables ms':>10} {'us/sample(3)':>13}")
+    for size in args.sizes:
+        rows = _synthetic_category(bank, size)
+        start = time.perf_counter()
+        pool = WeightedPool(rows, [bank_categories[i % len(bank)] for i in range(size)])
+        build = time.perf_counter() - start
+        start = time.perf_counter()
+        for word, pos, cat_id, difficulty in queries:
+            pool.table((cat_id, pos, difficulty))
+        tables = time.perf_counter() - start
+        seconds = _best_of(args.repeat, lambda: [pool.sample(*q, 3, rng) for q in queries])
+        print(f"{size:>8} {len(pool.keys):>7} {build * 1e3:>9.1f} {tables * 1e3:>10.1f} "
+              f"{seconds / len(queries) * 1e6:>13.2f}")
+
+def _write_child(path, outpath):
+    """Render the dataset without the build cache and write it by one path, printing its footprint as JSON"""
+    import generate_vocab as g
+    table = g.load_words()
+    before = g.peak_memory_mb()
+    start = time.perf_counter()
+    if path == "collect":
+        g.write_dataset(g.render_dataset(table, use_cache=False), outpath)
+    else:
+        blocks = (block for _, block in g.render_blocks(table, use_cache=False))
+        g.write_dataset_stream(outpath, g.dataset_header(), blocks)
+    print(json.dumps({
+        "path": path,
+        "seconds": time.perf_counter() - start,
+        "peak_rss_mb": g.peak_memory_mb(),
+        "write_rss_mb": g.peak_memory_mb() - before,
+    }))
+
+def bench_write(args):
+    """Peak RSS and time of collecting the dataset for json.dump vs the streaming writer"""
+    import tempfile
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = []
+        for path in ("collect", "stream"):
+            outpath = os.path.join(tmp, f"{path}.json")
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "write", "--path", path, "--output", outpath],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            results.append(json.loads(out.strip().splitlines()[-1]))
+            with open(outpath, "rb") as f:
+                outputs.append(f.read())
+    print(f"{'path':<8} {'seconds':>8} {'peak RSS':>12} {'render+write':>13}")
+    for r in results:
+        print(f"{r['path']:<8} {r['seconds']:>8.2f} {r['peak_rss_mb']:>8.2f} MiB {r['write_rss_mb']:>8.2f} MiB")
+    collect_mb, stream_mb = results[0]["peak_rss_mb"], results[1]["peak_rss_mb"]
+    print(f"Peak RSS change: {stream_mb - collect_mb:+.2f} MiB ({(stream_mb - collect_mb) / collect_mb * 100:+.1f}%); "
+          f"outputs {'identical' if outputs[0] == outputs[1] else 'DIFFER'} ({len(outputs[1]) / 1024:,.0f} KB)")
+
+def bench_distractors(args):
+    """Build time and per-query latency of the orthographic SimilarityIndex as the indexed vocabulary grows"""
+    import generate_vocab as g
+    from distractors import SimilarityIndex
+    from lexicon import Lexicon
+    table = g.load_words()
+    bank = table.rows(range(len(table)))
+    # Pad the bank with lexicon words, given parts of speech in the bank's proportions
+    rng = random.Random(0)
+    known = {w[0] for w in bank}
+    extra = [w for w in Lexicon.load().blob.decode("ascii").split() if w not in known]
+    rng.shuffle(extra)
+    print(f"{'words':>7} {'build ms':>9} {'query ms':>9} {'p99 ms':>8}")
+    for size in args.sizes:
+        rows = bank + [(w, rng.choice(bank)[1], [], w, 1) for w in extra[:max(0, size - len(bank))]]
+        start = time.perf_counter()
+        index = SimilarityIndex(rows)
+        build = time.perf_counter() - start
+        latencies = []
+        for w in bank:
+            start = time.perf_counter()
+            index.nearest(w[0], w[1], 3)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"{len(index):>7} {build * 1e3:>9.1f} {sum(latencies) / len(latencies) * 1e3:>9.3f} "
+              f"{latencies[int(len(latencies) * 0.99)] * 1e3:>8.3f}")
+    index = SimilarityIndex(bank)
+    for word in args.words:
+        pos = next((w[1] for w in bank if w[0] == word), None)
+        if pos is not None:
+            print(f"{word} ({pos}): {', '.join(w[0] for w in index.nearest(word, pos, 5))}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vocabulary build benchmarks")
+    sub = parser.add_subparsers(dest="benchmark", required=True)
+    memory = sub.add_parser("memory", help="peak RSS of tuple rows vs interned WordEntry rows")
+    memory.add_argument("--layout", choices=["tuple", "entry"], help="measure a single layout in this process")
+    phonetics = sub.add_parser("phonetics", help="per-word vs batched phonetic conversion throughput")
+    phonetics.add_argument("--limit", type=int, help="only convert the first N unique words")
+    phonetics.add_argument("--chunk", type=int, help="tokens per eng_to_ipa query (default: generate_vocab.PHONETIC_CHUNK)")
+    templates = sub.add_parser("templates", help="per-sentence cost of the compiled template renderer")
+    templates.add_argument("--repeat", type=int, default=5, help="best of N runs (default: 5)")
+    questions = sub.add_parser("questions", help="question generation cost as category size grows")
+    questions.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000, 8000],
+                           help="category sizes to generate (default: 500 1000 2000 4000 8000)")
+    questions.add_argument("--repeat", type=int, default=3, help="best of N runs (default: 3)")
+    write = sub.add_parser("write", help="peak RSS of json.dump on the collected dataset vs the streaming writer")
+    write.add_argument("--path", choices=["collect", "stream"], help="measure a single path in this process")
+    write.add_argument("--output", help="with --path: file to write")
+    pool = sub.add_parser("pool", help="per-draw cost of the weighted global distractor pool as the vocabulary grows")
+    pool.add_argument("--sizes", type=int, nargs="+", default=[4000, 10000, 40000, 100000],
+                      help="pool sizes, cycled from the bank (default: 4000 10000 40000 100000)")
+    pool.add_argument("--repeat", type=int, default=3, help="best of N runs (default: 3)")
+    distractors = sub.add_parser("distractors", help="latency of orthographic distractor lookups as the vocabulary grows")
+    distractors.add_argument("--sizes", type=int, nargs="+", default=[4000, 10000, 20000, 50000],
+                             help="indexed vocabulary sizes; the bank is padded with lexicon words (default: 4000 10000 20000 50000)")
+    distractors.add_argument("--words", nargs="+", default=["adopt", "precede", "efficient", "revenue"],
+                             help="bank words whose nearest neighbours are printed")
+    args = parser.parse_args(argv)
+
+    if args.benchmark == "memory":
+        if args.layout:
+            _memory_child(args.layout)
+        else:
+            bench_memory(args)
+    elif args.benchmark == "phonetics":
+        bench_phonetics(args)
+    elif args.benchmark == "templates":
+        bench_templates(args)
+    elif args.benchmark == "questions":
+        bench_questions(args)
+    elif args.benchmark == "write":
+        if args.path:
+            _write_child(args.path, args.output)
+        else:
+            bench_write(args)
+    elif args.benchmark == "pool":
+        bench_pool(args)
+    elif args.benchmark == "distractors":
+        bench_distractors(args)
+
+if __name__ == "__main__":
+    main()
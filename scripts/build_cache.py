@@ -0,0 +1,61 @@
+"""Build cache helpers - source fingerprints, snapshots and the build manifest"""
+import hashlib, json, os, pickle
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+# Bump when the snapshot layout changes so stale files are ignored
+SNAPSHOT_VERSION = 1
+
+def fingerprint_file(path):
+    """Return the sha256 hex digest of a file's contents"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def fingerprint_modules(module_names):
+    """Map each module in scripts/ to the content hash of its source file"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return {name: fingerprint_file(os.path.join(base_dir, f"{name}.py")) for name in module_names}
+
+def load_snapshot(path, key):
+    """Return the snapshot stored at path if it was built from the same key, else None"""
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(snapshot, dict):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("key") != key:
+        return None
+    return snapshot
+
+def save_snapshot(path, key, payload, build_seconds):
+    """Atomically write payload to path together with its key and build time"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "key": key,
+        "build_seconds": build_seconds,
+        "payload": payload,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+def load_manifest(path):
+    """Return the build manifest written by the previous build, or {} if there is none"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def save_manifest(path, manifest):
+    """Atomically write the build manifest as JSON"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -0,0 +1,215 @@
+"""Compiled suffix-rule engine - the single derivation rule table used by the build"""
+from collections import Counter, namedtuple
+
+from lexicon import Lexicon
+from word_entry import WordEntry
+
+Rule = namedtuple("Rule", ["id", "from_pos", "to_pos", "strip", "add", "zh_hint", "min_len", "exclude", "enabled"])
+
+def _rule(rule_id, from_pos, to_pos, strip, add, zh_hint, min_len=0, exclude=(), enabled=False):
+    return Rule(rule_id, from_pos, to_pos, strip, add, zh_hint, min_len, exclude, enabled)
+
+# Unified rule table, in application order. Replaces SUFFIX_RULES (words_derived),
+# DERIVATION_MAP (words_family), DERIVATION_RULES (words_expand) and the lambda
+# rules of generate_vocab. Only the adj -> adv rules are enabled by default: the
+# others produced forms like 'incuring', 'transformment' and 'confidentness'.
+# Candidates are checked against the lexicon, so more rules can be switched on
+# per build (generate_vocab.py --enable-rules). web2 still lists archaic forms
+# such as 'teachment' and 'convenientness', so review the reject report first.
+# min_len applies to the base word; exclude lists base endings a rule must skip.
+RULES = [
+    # Verb -> Noun (action/result)
+    _rule("v-ate-ation", "v", "n", "ate", "ation", "...的行為"),
+    _rule("v-ize-ization", "v", "n", "ize", "ization", "...的行為"),
+    _rule("v-ify-ification", "v", "n", "ify", "ification", "...的行為"),
+    _rule("v-e-ation", "v", "n", "e", "ation", "...的行為"),
+    _rule("v-tion", "v", "n", "", "tion", "...的行為"),
+    _rule("v-ment", "v", "n", "", "ment", "...的結果"),
+    _rule("v-e-ance", "v", "n", "e", "ance", "...的狀態"),
+    _rule("v-ance", "v", "n", "", "ance", "...的狀態"),
+    _rule("v-ence", "v", "n", "", "ence", "...的狀態"),
+    _rule("v-e-ing", "v", "n", "e", "ing", "...的行為"),
+    _rule("v-ing", "v", "n", "", "ing", "...的行為"),
+    # Verb -> Agent noun
+    _rule("v-e-or", "v", "n", "e", "or", "...的人"),
+    _rule("v-e-er", "v", "n", "e", "er", "...的人"),
+    _rule("v-er", "v", "n", "", "er", "...的人"),
+    # Verb -> Adjective
+    _rule("v-e-able", "v", "adj", "e", "able", "可...的"),
+    _rule("v-able", "v", "adj", "", "able", "可...的"),
+    _rule("v-e-ive", "v", "adj", "e", "ive", "...的"),
+    _rule("v-ive", "v", "adj", "", "ive", "...的"),
+    _rule("v-ed", "v", "adj", "", "ed", "...的"),
+    # Noun -> Adjective
+    _rule("n-al", "n", "adj", "", "al", "...的"),
+    _rule("n-y-ical", "n", "adj", "y", "ical", "...的"),
+    _rule("n-ous", "n", "adj", "", "ous", "充滿...的"),
+    _rule("n-ful", "n", "adj", "", "ful", "充滿...的"),
+    _rule("n-less", "n", "adj", "", "less", "缺少...的"),
+    _rule("n-ive", "n", "adj", "", "ive", "...的"),
+    # Adjective -> Adverb (-ly) - safe transformations
+    _rule("adj-ly", "adj", "adv", "", "ly", "...地", min_len=5, exclude=("ly", "y", "le"), enabled=True),
+    _rule("adj-y-ily", "adj", "adv", "y", "ily", "...地", min_len=5, exclude=("ly", "ey"), enabled=True),
+    _rule("adj-le-ly", "adj", "adv", "le", "ly", "...地", min_len=6, enabled=True),
+    _rule("adj-ic-ically", "adj", "adv", "ic", "ically", "...地", enabled=True),
+    # Adjective -> Noun
+    _rule("adj-ness", "adj", "n", "", "ness", "...的特質"),
+    _rule("adj-t-ce", "adj", "n", "t", "ce", "...的狀態"),
+    _rule("adj-ity", "adj", "n", "", "ity", "...的性質"),
+    _rule("adj-le-ility", "adj", "n", "le", "ility", "...的特質"),
+]
+
+# Bounds on the length of a derived word
+MIN_DERIVED_LEN = 5
+MAX_DERIVED_LEN = 20
+
+# Derived forms known to be wrong even though a rule produces them
+BLOCKLIST = {"confidentness"}
+
+def derived_meaning(rule, base_meaning, derived):
+    """Turn the base word's first gloss into a gloss for the derived form"""
+    if rule.from_pos == "adj" and rule.to_pos == "n" and derived.endswith("ness"):
+        return base_meaning[:-1] if base_meaning.endswith("的") else base_meaning + "性"
+    if rule.from_pos == "adj" and rule.to_pos == "adv":
+        return (base_meaning[:-1] if base_meaning.endswith("的") else base_meaning) + "地"
+    if rule.from_pos == "v" and rule.to_pos == "n":
+        if derived.endswith("er") or derived.endswith("r"):
+            return base_meaning + "者"
+        if derived.endswith("ment"):
+            return base_meaning
+    if rule.from_pos == "v" and rule.to_pos == "adj":
+        return base_meaning if base_meaning.endswith("的") else base_meaning + "的"
+    return rule.zh_hint
+
+class DerivationEngine:
+    """Rule engine indexed by (from_pos, base ending).
+
+    Each word only consults the rules whose strip ending it actually has, so
+    the cost per word is one dict lookup per distinct strip length rather than
+    a pass over every rule. hits counts derived forms per rule id.
+    """
+
+    def __init__(self, rules=None, include_disabled=False, enable=(), lexicon=None):
+        rules = RULES if rules is None else rules
+        unknown = set(enable) - {r.id for r in rules}
+        if unknown:
+            raise ValueError(f"unknown derivation rules: {', '.join(sorted(unknown))}")
+        self.rules = [r for r in rules if r.enabled or include_disabled or r.id in enable]
+        self.lexicon = lexicon
+        self.rejects = []
+        self.order = {r.id: i for i, r in enumerate(self.rules)}
+        self.index = {}
+        self.strip_lengths = {}
+        for r in self.rules:
+            self.index.setdefault((r.from_pos, r.strip), []).append(r)
+            lengths = self.strip_lengths.setdefault(r.from_pos, [])
+            if len(r.strip) not in lengths:
+                lengths.append(len(r.strip))
+        self.hits = Counter()
+
+    def candidates(self, word, pos):
+        """Rules applicable to word as pos, in table order, with their derived forms"""
+        found = []
+        for n in self.strip_lengths.get(pos, ()):
+            if len(word) <= n:
+                continue
+            stem, ending = (word[:-n], word[-n:]) if n else (word, "")
+            for r in self.index.get((pos, ending), ()):
+                if len(word) < r.min_len or word.endswith(r.exclude):
+                    continue
+                found.append((r, stem + r.add))
+        if len(found) > 1:
+            found.sort(key=lambda item: self.order[item[0].id])
+        return found
+
+    def reject_reason(self, derived, is_known):
+        """Why a derived form must not be emitted, or None if it is acceptable"""
+        if not MIN_DERIVED_LEN <= len(derived) <= MAX_DERIVED_LEN:
+            return "length"
+        if is_known(derived):
+            return "exists"
+        if derived in BLOCKLIST:
+            return "blocklist"
+        if self.lexicon is not None and derived not in self.lexicon:
+            return "lexicon"
+        return None
+
+    def derive_category(self, rows, is_known, limit):
+        """Derive up to limit new entries from a category's rows, in row order.
+
+        is_known(word) reports words that already exist anywhere in the bank;
+        forms derived earlier in the same batch are tracked here. Returns a
+        list of (rule, base word, WordEntry) triples. Candidates refused by the
+        blocklist or the lexicon are appended to self.rejects.
+        """
+        produced = []
+        seen = set()
+        for word, pos, meanings, _, difficulty in rows:
+            if len(produced) >= limit:
+                break
+            for rule, derived in self.candidates(word, pos):
+                if len(produced) >= limit:
+                    break
+                if derived in seen:
+                    continue
+                reason = self.reject_reason(derived, is_known)
+                if reason is not None:
+                    if reason in ("blocklist", "lexicon"):
+                        self.rejects.append({"rule": rule.id, "base": word, "derived": derived, "reason": reason})
+                    continue
+                base_meaning = meanings[0] if isinstance(meanings, list) else meanings
+                colloc = f"{derived} effectively" if rule.to_pos == "adv" else derived
+                entry = WordEntry.intern((derived, rule.to_pos, [derived_meaning(rule, base_meaning, derived)],
+                                          colloc, min(difficulty + 1, 3)))
+                produced.append((rule, word, entry))
+                seen.add(derived)
+                self.hits[rule.id] += 1
+        return produced
+
+def allocate_quota(sizes, available, total):
+    """Split total derivations across categories in proportion to their size.
+
+    sizes and available map cat_id -> category size and number of candidates.
+    Shares are integer floors plus largest remainders (ties broken by cat_id);
+    quota a category cannot use is redistributed among the others, so the
+    result depends only on the inputs, never on the order categories finish.
+    """
+    quota = {cat_id: 0 for cat_id in sizes}
+    remaining = total
+    open_cats = sorted(c for c in sizes if available.get(c, 0) > 0)
+    while remaining > 0 and open_cats:
+        weights = {c: sizes[c] or 1 for c in open_cats}
+        weight = sum(weights.values())
+        shares = {c: divmod(remaining * weights[c], weight) for c in open_cats}
+        granted = 0
+        for c in open_cats:
+            take = min(shares[c][0], available[c] - quota[c])
+            quota[c] += take
+            granted += take
+        if granted == 0:
+            for c in sorted(open_cats, key=lambda c: (-shares[c][1], c))[:remaining]:
+                quota[c] += 1
+                granted += 1
+        remaining -= granted
+        open_cats = [c for c in open_cats if quota[c] < available[c]]
+    return quota
+
+# Per-process state for derive_candidates, set up once by init_worker
+_worker = {}
+
+def init_worker(enable, known, use_lexicon=True):
+    """Build the engine a worker process shares across its categories"""
+    _worker["engine"] = DerivationEngine(enable=enable, lexicon=Lexicon.load() if use_lexicon else None)
+    _worker["known"] = frozenset(known)
+
+def derive_candidates(cat_id, rows, limit):
+    """Derive one category's candidates independently of every other category.
+
+    Returns (cat_id, [(rule_id, base word, WordEntry)], rejects). Only words present
+    before derivation count as known, so the result does not depend on which
+    categories were processed first.
+    """
+    engine = _worker["engine"]
+    engine.rejects = []
+    produced = engine.derive_category(rows, _worker["known"].__contains__, limit)
+    return cat_id, [(rule.id, base, entry) for rule, base, entry in produced], engine.rejects
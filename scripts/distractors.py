@@ -0,0 +1,218 @@
+"""Distractor selection - per-category indexes of the words a question can offer as wrong choices"""
+import heapq, random
+from collections import Counter
+
+class DistractorIndex:
+    """One category's rows bucketed by part of speech, built once per category.
+
+    sample() never builds the candidate list: it runs random.sample over a
+    range the size of the bucket minus the target's own rows, and pick()
+    shifts each drawn index past those rows. It consumes the same random
+    numbers and returns the same rows as random.sample over the filtered
+    list, at a cost that does not depend on the size of the category.
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.by_pos = {}
+        self.pos_positions = {}     # (pos, word) -> indexes of word's rows in the pos bucket
+        self.row_positions = {}     # word -> indexes of word's rows in rows
+        for i, w in enumerate(rows):
+            bucket = self.by_pos.setdefault(w[1], [])
+            self.pos_positions.setdefault((w[1], w[0]), []).append(len(bucket))
+            bucket.append(w)
+            self.row_positions.setdefault(w[0], []).append(i)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def pool(self, word, pos, k=3):
+        """(bucket, excluded) for word: the rows its distractors come from and, in
+        ascending order, the positions of word's own rows in them"""
+        bucket = self.by_pos.get(pos, ())
+        excluded = self.pos_positions.get((pos, word), ())
+        if len(bucket) - len(excluded) < k:
+            return self.rows, self.row_positions.get(word, ())
+        return bucket, excluded
+
+    @staticmethod
+    def pick(bucket, excluded, indexes):
+        """Rows of bucket at indexes counted with the excluded positions left out"""
+        picked = []
+        for j in indexes:
+            for e in excluded:
+                if e > j:
+                    break
+                j += 1
+            picked.append(bucket[j])
+        return picked
+
+    def sample(self, word, pos, k=3, rng=random):
+        """Up to k rows other than word, of the same POS unless fewer than k of those exist"""
+        bucket, excluded = self.pool(word, pos, k)
+        n = len(bucket) - len(excluded)
+        return self.pick(bucket, excluded, rng.sample(range(n), min(k, n)))
+
+# Shared suffixes of this length ('-tion', '-ment', '-ance') earn SUFFIX_BONUS on top of the trigram score
+SUFFIX_LEN = 4
+SUFFIX_BONUS = 0.25
+
+def trigrams(word):
+    """Character trigrams of word padded with ^ and $, so starts and endings count too"""
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SimilarityIndex:
+    """Orthographic neighbours of a word among the bank words of the same part of speech.
+
+    Every (word, pos) entry is posted under its padded character trigrams and
+    its SUFFIX_LEN-letter ending, per POS. nearest() only visits the postings
+    of the query's own trigrams and suffix, so its cost follows the number of
+    words sharing a trigram with the query instead of the size of the bank.
+    Candidates are ranked by the Dice coefficient of the trigram sets plus
+    the suffix bonus, then by closeness in length, then by bank order.
+    """
+
+    def __init__(self, rows):
+        self.rows = []
+        self.gram_counts = []
+        self.grams = {}             # pos -> trigram -> [entry index]
+        self.suffixes = {}          # pos -> ending -> [entry index]
+        seen = set()
+        for w in rows:
+            if (w[0], w[1]) in seen:
+                continue
+            seen.add((w[0], w[1]))
+            i = len(self.rows)
+            self.rows.append(w)
+            grams = trigrams(w[0])
+            self.gram_counts.append(len(grams))
+            postings = self.grams.setdefault(w[1], {})
+            for g in grams:
+                postings.setdefault(g, []).append(i)
+            if len(w[0]) > SUFFIX_LEN:
+                self.suffixes.setdefault(w[1], {}).setdefault(w[0][-SUFFIX_LEN:], []).append(i)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def nearest(self, word, pos, k=3):
+        """Up to k rows of the given POS most similar in spelling to word, most similar first"""
+        grams = trigrams(word)
+        shared = Counter()
+        postings = self.grams.get(pos, {})
+        for g in grams:
+            shared.update(postings.get(g, ()))
+        n = len(grams)
+        scores = {i: 2 * c / (n + self.gram_counts[i]) for i, c in shared.items()}
+        if len(word) > SUFFIX_LEN:
+            for i in self.suffixes.get(pos, {}).get(word[-SUFFIX_LEN:], ()):
+                scores[i] += SUFFIX_BONUS
+        rows = self.rows
+        ranked = heapq.nlargest(k + 1, scores, key=lambda i: (scores[i], -abs(len(rows[i][0]) - len(word)), -i))
+        return [rows[i] for i in ranked if rows[i][0] != word][:k]
+
+    def pick(self, word_entry, cat_id, idx, k, rng):
+        """Distractors for question idx of a word: the next k neighbours after those of earlier questions"""
+        return self.nearest(word_entry[0], word_entry[1], k * (idx + 1))[k * idx:]
+
+# Relative preference of a global-pool candidate, multiplied together
+POS_WEIGHT = 100.0                      # same part of speech as the answer
+CATEGORY_WEIGHT = 8.0                   # same category
+DIFFICULTY_WEIGHTS = (4.0, 2.0, 1.0)    # by difficulty distance 0, 1, 2+
+MAX_DRAWS = 50                          # per distractor, before giving up on a pool with too few words
+
+class AliasTable:
+    """Walker's alias method: O(1) draws from a fixed discrete distribution.
+
+    Built with Vose's O(n) construction. A draw takes one uniform number:
+    its integer part picks a column, its fraction decides between the
+    column and its alias.
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def __len__(self):
+        return len(self.prob)
+
+    def draw(self, rng):
+        x = rng.random() * len(self.prob)
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+class WeightedPool:
+    """Distractors drawn from every category of the bank, weighted towards the answer.
+
+    A candidate's weight is POS_WEIGHT if it shares the answer's part of
+    speech, times CATEGORY_WEIGHT if it shares its category, times
+    DIFFICULTY_WEIGHTS by difficulty distance. Weights only depend on the
+    (category, pos, difficulty) stratum of both words, so one alias table
+    per answer stratum picks a candidate stratum and a uniform draw picks a
+    word inside it: each draw is O(1) and the tables grow with the number of
+    strata, not of words. Tables are built the first time a stratum asks.
+    """
+
+    def __init__(self, rows, categories):
+        self.strata = {}
+        for w, cat_id in zip(rows, categories):
+            self.strata.setdefault((cat_id, w[1], w[4]), []).append(w)
+        self.keys = list(self.strata)
+        self.members = [self.strata[key] for key in self.keys]
+        self.tables = {}
+
+    @classmethod
+    def from_table(cls, table):
+        """Pool of every row of a WordTable, each in its own category"""
+        return cls(table.rows(range(len(table))), [table.categories[c] for c in table.category])
+
+    def __len__(self):
+        return sum(len(m) for m in self.members)
+
+    def weight(self, target, candidate):
+        """Relative weight of one word of stratum candidate as a distractor for an answer of stratum target"""
+        weight = DIFFICULTY_WEIGHTS[min(abs(target[2] - candidate[2]), len(DIFFICULTY_WEIGHTS) - 1)]
+        if target[1] == candidate[1]:
+            weight *= POS_WEIGHT
+        if target[0] == candidate[0]:
+            weight *= CATEGORY_WEIGHT
+        return weight
+
+    def table(self, target):
+        table = self.tables.get(target)
+        if table is None:
+            table = self.tables[target] = AliasTable([len(m) * self.weight(target, key)
+                                                      for key, m in zip(self.keys, self.members)])
+        return table
+
+    def sample(self, word, pos, cat_id, difficulty, k=3, rng=random):
+        """Up to k distinct words other than word; fewer only if the pool runs out of them"""
+        table = self.table((cat_id, pos, difficulty))
+        members = self.members
+        picked, seen = [], {word}
+        for _ in range(k * MAX_DRAWS):
+            stratum = members[table.draw(rng)]
+            w = stratum[int(rng.random() * len(stratum))]
+            if w[0] not in seen:
+                seen.add(w[0])
+                picked.append(w)
+                if len(picked) == k:
+                    break
+        return picked
+
+    def pick(self, word_entry, cat_id, idx, k, rng):
+        return self.sample(word_entry[0], word_entry[1], cat_id, word_entry[4], k, rng)
@@ -0,0 +1,143 @@
+"""Word-family graph - base -> derived links between words of the bank, as adjacency arrays"""
+import os
+from array import array
+
+from derivation import RULES, DerivationEngine
+
+GRAPH_VERSION = 1
+
+FAMILY_LINKS_PATH = os.path.join(os.path.dirname(__file__), "data", "family_links.tsv")
+
+def load_family_links(path=FAMILY_LINKS_PATH):
+    """Read the curated (base, derived) pairs of data/family_links.tsv, or an empty set if it is missing"""
+    links = set()
+    if not os.path.exists(path):
+        return links
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            base, derived = line.rstrip("\n").split("\t")
+            links.add((base, derived))
+    return links
+
+class FamilyGraph:
+    """Directed base -> derived graph in compressed sparse row form.
+
+    Node i is words[i] (sorted, only words with at least one link). The forms
+    derived from node i are derived_targets[derived_offsets[i]:derived_offsets[i + 1]],
+    with the rule that links them in derived_rules. Connected components are
+    precomputed, so a family is the family_members slice for family[i] and a
+    lookup costs one dict probe plus one slice.
+    """
+
+    def __init__(self, words, rules, edges):
+        self.words = words
+        self.rules = rules
+        self.node = {w: i for i, w in enumerate(words)}
+        self.derived_offsets = array("I", [0])
+        self.derived_targets = array("I")
+        self.derived_rules = array("B")
+        for i in range(len(words)):
+            for target, rule_idx in edges.get(i, ()):
+                self.derived_targets.append(target)
+                self.derived_rules.append(rule_idx)
+            self.derived_offsets.append(len(self.derived_targets))
+        self._build_families()
+
+    def _build_families(self):
+        parent = list(range(len(self.words)))
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(len(self.words)):
+            for target in self.derived_targets[self.derived_offsets[i]:self.derived_offsets[i + 1]]:
+                a, b = root(i), root(target)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+        family_ids = {}
+        self.family = array("I", (family_ids.setdefault(root(i), len(family_ids)) for i in range(len(self.words))))
+        members = [[] for _ in family_ids]
+        for i, f in enumerate(self.family):
+            members[f].append(i)
+        self.family_offsets = array("I", [0])
+        self.family_members = array("I")
+        for nodes in members:
+            self.family_members.extend(nodes)
+            self.family_offsets.append(len(self.family_members))
+
+    @classmethod
+    def from_table(cls, table, rules=RULES, curated=None):
+        """Link the words of a WordTable base -> derived.
+
+        Auto-derived forms are linked to the base word and rule the build
+        derived them with (table.derived_from). Hand-written forms such as
+        'accomplishment' are matched against the rule table instead, and a
+        match is only kept when its rule is enabled or the (base, derived)
+        pair is listed in curated (data/family_links.tsv by default): the
+        disabled rules also match pairs like intern -> internal. A link needs
+        the derived word in the bank with the rule's target POS.
+        """
+        curated = load_family_links() if curated is None else curated
+        engine = DerivationEngine(rules, include_disabled=True)
+        rule_index = {r.id: i for i, r in enumerate(engine.rules)}
+        entries = sorted({(table.words[i], table.pos_tags[table.pos[i]]) for i in range(len(table))})
+        pos_of = {}
+        for word, pos in entries:
+            pos_of.setdefault(word, set()).add(pos)
+        links = [(base, derived, rule_index[rule_id]) for derived, (base, rule_id) in table.derived_from.items()]
+        for word, pos in entries:
+            for rule, derived in engine.candidates(word, pos):
+                if (derived != word and derived not in table.derived_from and rule.to_pos in pos_of.get(derived, ())
+                        and (rule.enabled or (word, derived) in curated)):
+                    links.append((word, derived, rule_index[rule.id]))
+        words = sorted({w for base, derived, _ in links for w in (base, derived)})
+        node = {w: i for i, w in enumerate(words)}
+        edges, seen = {}, set()
+        for base, derived, rule_idx in sorted(links):
+            if (base, derived) not in seen:
+                seen.add((base, derived))
+                edges.setdefault(node[base], []).append((node[derived], rule_idx))
+        return cls(words, engine.rules, edges)
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def edge_count(self):
+        return len(self.derived_targets)
+
+    def derived(self, word):
+        """(derived word, rule id) pairs for the forms derived directly from word"""
+        i = self.node.get(word)
+        if i is None:
+            return []
+        start, end = self.derived_offsets[i], self.derived_offsets[i + 1]
+        return [(self.words[t], self.rules[r].id)
+                for t, r in zip(self.derived_targets[start:end], self.derived_rules[start:end])]
+
+    def family_of(self, word):
+        """Every word in word's family, in sorted order (just [word] if it has none)"""
+        i = self.node.get(word)
+        if i is None:
+            return [word]
+        f = self.family[i]
+        return [self.words[m] for m in self.family_members[self.family_offsets[f]:self.family_offsets[f + 1]]]
+
+    def to_json(self):
+        """Plain-list form of the arrays, for word_families.json"""
+        return {
+            "version": GRAPH_VERSION,
+            "rules": [{"id": r.id, "from_pos": r.from_pos, "to_pos": r.to_pos} for r in self.rules],
+            "words": self.words,
+            "derived_offsets": self.derived_offsets.tolist(),
+            "derived_targets": self.derived_targets.tolist(),
+            "derived_rules": self.derived_rules.tolist(),
+            "family": self.family.tolist(),
+            "family_offsets": self.family_offsets.tolist(),
+            "family_members": self.family_members.tolist(),
+        }
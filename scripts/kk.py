@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""KK (Kenyon-Knott) phonetics - IPA to KK conversion and the bundled pronunciation table
+
+data/pronunciations.tsv maps word tokens to American IPA (as produced by
+eng_to_ipa from the CMU Pronouncing Dictionary), so the build produces KK
+transcriptions without any optional dependency. Refresh it with
+`python kk.py build-table` after adding words.
+"""
+import argparse, os
+from functools import lru_cache
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+PRONUNCIATIONS_PATH = os.path.join(DATA_DIR, "pronunciations.tsv")
+
+# Bump when the conversion rules change, to invalidate cached phonetics
+KK_VERSION = 2
+
+# Single code points rewritten after segmentation: affricates, stress marks, script g
+_TRANSLATE = str.maketrans({"ʧ": "tʃ", "ʤ": "dʒ", "ɡ": "g", "ˈ": "ˋ", "ˌ": "ˏ"})
+
+# Vowel segments, longest first: IPA -> (unstressed KK, stressed KK)
+_VOWELS = {
+    "aɪ": ("aɪ", "aɪ"), "aʊ": ("aʊ", "aʊ"), "ɔɪ": ("ɔɪ", "ɔɪ"),
+    "eɪ": ("e", "e"), "oʊ": ("o", "o"), "ər": ("ɚ", "ɝ"),
+    "ə": ("ə", "ʌ"), "ɑ": ("ɑ", "ɑ"), "æ": ("æ", "æ"), "ɛ": ("ɛ", "ɛ"),
+    "ɪ": ("ɪ", "ɪ"), "i": ("i", "i"), "ʊ": ("ʊ", "ʊ"), "u": ("u", "u"),
+    "ɔ": ("ɔ", "ɔ"), "e": ("e", "e"), "o": ("o", "o"), "a": ("a", "a"),
+}
+_MAX_SEGMENT = max(len(s) for s in _VOWELS)
+_STRESS = {"ˈ", "ˌ"}
+_VOWEL_START = {s[0] for s in _VOWELS}
+
+# Unstressed final /əl/ and /ən/ become syllabic consonants: apple [ˋæpḷ], button [ˋbʌtṇ]
+_SYLLABIC = {"l": "ḷ", "n": "ṇ"}
+_SYLLABIC_N_AFTER = {"t", "d"}
+_NON_SYLLABIC_AFTER = _STRESS | {"r"}    # general [ˋdʒɛnərəl]
+
+def _segments(ipa):
+    """Split one IPA word into (segment, is_vowel) pairs by longest match"""
+    out = []
+    i = 0
+    while i < len(ipa):
+        for size in range(_MAX_SEGMENT, 0, -1):
+            piece = ipa[i:i + size]
+            if len(piece) == size and piece in _VOWELS:
+                i += size
+                if piece == "ər" and ipa[i:i + 1] in _VOWEL_START:
+                    # /r/ opens the next syllable: camera [ˋkæmərə]
+                    out += [("ə", True), ("r", False)]
+                elif piece == "ər" and ipa[i:i + 1] in _STRESS and ipa[i + 1:i + 2] in _VOWEL_START:
+                    # ... and moves behind its stress mark: operation [ˏɑpəˋreʃən]
+                    out += [("ə", True), (ipa[i], False), ("r", False)]
+                    i += 1
+                else:
+                    out.append((piece, True))
+                break
+        else:
+            out.append((ipa[i], False))
+            i += 1
+    return out
+
+def _word_to_kk(ipa):
+    segments = _segments(ipa)
+    # Without a stress mark the first vowel carries the stress (monosyllables)
+    stressed_next = not any(seg in _STRESS for seg, _ in segments)
+    kk = []
+    for i, (seg, is_vowel) in enumerate(segments):
+        if seg in _STRESS:
+            stressed_next = True
+            kk.append(seg)
+        elif is_vowel:
+            stressed = stressed_next
+            stressed_next = False
+            last, prev = segments[i + 1:], segments[i - 1] if i else None
+            if (not stressed and seg == "ə" and len(last) == 1 and last[0][0] in _SYLLABIC
+                    and prev is not None and not prev[1] and prev[0] not in _NON_SYLLABIC_AFTER
+                    and (last[0][0] == "l" or prev[0] in _SYLLABIC_N_AFTER)):
+                kk.append(_SYLLABIC[last[0][0]])
+                break
+            kk.append(_VOWELS[seg][stressed])
+        else:
+            kk.append(seg)
+    return "".join(kk).translate(_TRANSLATE)
+
+@lru_cache(maxsize=None)
+def ipa_to_kk(ipa):
+    """Convert a space-separated American IPA transcription to KK symbols"""
+    return " ".join(_word_to_kk(word) for word in ipa.split())
+
+@lru_cache(maxsize=None)
+def load_pronunciations(path=PRONUNCIATIONS_PATH):
+    """Read the bundled token -> IPA table, or {} if it is missing"""
+    table = {}
+    if not os.path.exists(path):
+        return table
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                continue
+            token, ipa = line.rstrip("\n").split("\t")
+            table[token] = ipa
+    return table
+
+def build_table(path=PRONUNCIATIONS_PATH):
+    """Regenerate the pronunciation table from eng_to_ipa for every token of the word bank"""
+    import generate_vocab as g
+    if not g.HAS_IPA:
+        raise SystemExit("eng_to_ipa is required to rebuild the pronunciation table")
+    table = dict(load_pronunciations(path))
+    tokens = sorted({t for w in g.load_words().words for t in w.split()})
+    found = g.ipa_lookup(tokens, table={})
+    table.update(found)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# token\tIPA (eng_to_ipa / CMU Pronouncing Dictionary); regenerate with python kk.py build-table\n")
+        for token in sorted(table):
+            f.write(f"{token}\t{table[token]}\n")
+    return len(tokens), len(found), len(table)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KK phonetics utilities")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build-table", help="refresh data/pronunciations.tsv from eng_to_ipa")
+    convert = sub.add_parser("convert", help="print the KK transcription of words")
+    convert.add_argument("words", nargs="+")
+    args = parser.parse_args(argv)
+
+    if args.command == "build-table":
+        tokens, found, total = build_table()
+        print(f"Looked up {tokens} tokens, {found} found; {total} entries in {os.path.relpath(PRONUNCIATIONS_PATH)}")
+    else:
+        import generate_vocab as g
+        for word in args.words:
+            print(f"{word}\t{g.get_kk_phonetic(word) or '-'}")
+
+if __name__ == "__main__":
+    main()
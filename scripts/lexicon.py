@@ -0,0 +1,59 @@
+"""Offline English lexicon - exact membership tests over a packed, sorted wordlist
+
+data/english_words.txt.gz is the web2 word list (Webster's Second
+International, public domain; FreeBSD share/dict revision 326913),
+lower-cased, alphabetic entries only, one word per line in sorted order.
+data/lexicon_supplement.txt adds modern forms web2 lacks.
+"""
+import gzip, os
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+WORDLIST_PATH = os.path.join(DATA_DIR, "english_words.txt.gz")
+SUPPLEMENT_PATH = os.path.join(DATA_DIR, "lexicon_supplement.txt")
+
+class Lexicon:
+    """Membership structure over one newline-separated, sorted bytes blob.
+
+    Lookups binary-search the blob directly, snapping each probe to the
+    surrounding line with bytes.rfind/find, so no per-word Python objects are
+    created at load time and a query costs ~18 probes (a few microseconds).
+    """
+
+    def __init__(self, blob, extra=()):
+        self.blob = blob.strip(b"\n") + b"\n"
+        self.extra = frozenset(extra)
+
+    @classmethod
+    def load(cls, wordlist_path=WORDLIST_PATH, supplement_path=SUPPLEMENT_PATH):
+        with gzip.open(wordlist_path, "rb") as f:
+            blob = f.read()
+        extra = []
+        if supplement_path and os.path.exists(supplement_path):
+            with open(supplement_path, encoding="utf-8") as f:
+                extra = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        return cls(blob, extra)
+
+    def __contains__(self, word):
+        word = word.lower()
+        if word in self.extra:
+            return True
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return False
+        if not key or b"\n" in key:
+            return False
+        blob = self.blob
+        lo, hi = 0, len(blob)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = blob.rfind(b"\n", lo, mid) + 1 or lo
+            end = blob.find(b"\n", mid)
+            line = blob[start:end]
+            if line < key:
+                lo = end + 1
+            elif line > key:
+                hi = start
+            else:
+                return True
+        return False
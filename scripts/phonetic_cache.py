@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Persistent phonetic cache - sqlite store of word -> KK transcription, keyed by converter version"""
+import argparse, os, sqlite3, time
+
+from build_cache import CACHE_DIR
+
+PHONETIC_CACHE_PATH = os.path.join(CACHE_DIR, "phonetics.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS phonetics (
+    word TEXT NOT NULL,
+    converter TEXT NOT NULL,
+    phonetic TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (word, converter)
+) WITHOUT ROWID
+"""
+
+class PhoneticCache:
+    """Word -> phonetic lookups backed by sqlite.
+
+    Rows are keyed by (word, converter) so a new converter version never
+    serves stale transcriptions. With warm=True every row of the current
+    converter is read in one query up front and lookups are dict probes;
+    otherwise each first lookup of a word runs one indexed SELECT. New and
+    touched rows are written in a single transaction by flush().
+    """
+
+    def __init__(self, converter, path=PHONETIC_CACHE_PATH, warm=True):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.converter = converter
+        self.warm = warm
+        self.db = sqlite3.connect(path)
+        self.db.execute(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.memo = {}
+        self.pending = {}
+        self.used = set()
+        if warm:
+            self.memo = dict(self.db.execute("SELECT word, phonetic FROM phonetics WHERE converter = ?", (converter,)))
+
+    def _lookup(self, word):
+        phonetic = self.memo.get(word)
+        if phonetic is None and not self.warm:
+            row = self.db.execute("SELECT phonetic FROM phonetics WHERE word = ? AND converter = ?",
+                                  (word, self.converter)).fetchone()
+            if row is not None:
+                phonetic = self.memo[word] = row[0]
+        return phonetic
+
+    def get(self, word, compute):
+        """Return word's phonetic, calling compute(word) only on a cache miss"""
+        phonetic = self._lookup(word)
+        if phonetic is not None:
+            self.hits += 1
+            self.used.add(word)
+            return phonetic
+        self.misses += 1
+        phonetic = self.memo[word] = self.pending[word] = compute(word)
+        return phonetic
+
+    def get_many(self, words, compute_batch):
+        """Return {word: phonetic} for words, converting all misses with one compute_batch(misses) call"""
+        found, missing = {}, []
+        for word in words:
+            phonetic = self._lookup(word)
+            if phonetic is None:
+                missing.append(word)
+            else:
+                found[word] = phonetic
+        self.hits += len(found)
+        self.misses += len(missing)
+        self.used.update(found)
+        if missing:
+            computed = compute_batch(missing)
+            self.memo.update(computed)
+            self.pending.update(computed)
+            found.update(computed)
+        return found
+
+    def flush(self):
+        """Store new transcriptions and refresh last_used for the words looked up"""
+        now = int(time.time())
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO phonetics VALUES (?, ?, ?, ?)",
+                                [(w, self.converter, p, now) for w, p in self.pending.items()])
+            self.db.executemany("UPDATE phonetics SET last_used = ? WHERE word = ? AND converter = ?",
+                                [(now, w, self.converter) for w in self.used])
+        self.pending.clear()
+        self.used.clear()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+def cache_info(path=PHONETIC_CACHE_PATH):
+    """Row counts per converter version and the file size of the cache"""
+    if not os.path.exists(path):
+        return {"converters": {}, "bytes": 0}
+    with sqlite3.connect(path) as db:
+        db.execute(SCHEMA)
+        converters = dict(db.execute("SELECT converter, COUNT(*) FROM phonetics GROUP BY converter"))
+    return {"converters": converters, "bytes": os.path.getsize(path)}
+
+def vacuum(path=PHONETIC_CACHE_PATH, keep_converter=None, max_age_days=None):
+    """Evict rows of other converter versions and/or rows unused for max_age_days, then compact the file.
+
+    Returns the number of rows deleted.
+    """
+    if not os.path.exists(path):
+        return 0
+    db = sqlite3.connect(path)
+    try:
+        db.execute(SCHEMA)
+        deleted = 0
+        with db:
+            if keep_converter is not None:
+                deleted += db.execute("DELETE FROM phonetics WHERE converter != ?", (keep_converter,)).rowcount
+            if max_age_days is not None:
+                cutoff = int(time.time() - max_age_days * 86400)
+                deleted += db.execute("DELETE FROM phonetics WHERE last_used < ?", (cutoff,)).rowcount
+        db.execute("VACUUM")
+    finally:
+        db.close()
+    return deleted
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or compact the persistent phonetic cache")
+    parser.add_argument("command", choices=("stats", "vacuum", "clear"))
+    parser.add_argument("--max-age-days", type=float, help="vacuum: also evict words not looked up for this many days")
+    parser.add_argument("--all-converters", action="store_true",
+                        help="vacuum: keep rows of other converter versions instead of evicting them")
+    args = parser.parse_args(argv)
+
+    if args.command == "clear":
+        if os.path.exists(PHONETIC_CACHE_PATH):
+            os.remove(PHONETIC_CACHE_PATH)
+        print(f"Removed {PHONETIC_CACHE_PATH}")
+        return
+    if args.command == "vacuum":
+        from generate_vocab import phonetic_converter
+        keep = None if args.all_converters else phonetic_converter()
+        deleted = vacuum(keep_converter=keep, max_age_days=args.max_age_days)
+        print(f"Evicted {deleted} rows")
+    info = cache_info()
+    for converter, count in sorted(info["converters"].items()):
+        print(f"{converter}: {count} words")
+    print(f"{PHONETIC_CACHE_PATH}: {info['bytes'] / 1024:.1f} KB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Sentence and question template banks, compiled once into literal/slot segments"""
+from string import Formatter
+
+class Template:
+    """A format string pre-split into literal and slot segments.
+
+    render() fills the slots by concatenation, without re-parsing the
+    format string on every call. Only bare {name} fields are supported.
+    """
+    __slots__ = ("text", "literals", "slots")
+
+    def __init__(self, text):
+        literals, slots = [], []
+        for literal, field, spec, conversion in Formatter().parse(text):
+            if spec or conversion:
+                raise ValueError(f"unsupported field format in template: {text!r}")
+            literals.append(literal)
+            if field is not None:
+                slots.append(field)
+        if len(literals) == len(slots):
+            literals.append("")
+        self.text = text
+        self.literals = tuple(literals)
+        self.slots = tuple(slots)
+
+    def render(self, **values):
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            parts.append(values[slot])
+            parts.append(literal)
+        return "".join(parts)
+
+    def fill(self, value):
+        """Render a single-slot template"""
+        literals = self.literals
+        return literals[0] + value + literals[1]
+
+    def fill_span(self, value):
+        """Render a single-slot template, returning (text, start, end) of the inserted value"""
+        literals = self.literals
+        start = len(literals[0])
+        return literals[0] + value + literals[1], start, start + len(value)
+
+class TemplateBank:
+    """POS -> list of compiled template tuples, falling back to a default POS; table lists them all"""
+    __slots__ = ("by_pos", "fallback", "table")
+
+    def __init__(self, banks, fallback="n"):
+        self.by_pos = {}
+        self.table = []
+        for pos, templates in banks.items():
+            compiled = [tuple(Template(t) for t in group) for group in templates]
+            self.by_pos[pos] = compiled
+            self.table.extend(compiled)
+        self.fallback = self.by_pos[fallback]
+
+    def pick(self, pos, idx):
+        templates = self.by_pos.get(pos, self.fallback)
+        return templates[idx % len(templates)]
+
+# English sentence templates, first sentence of every word
+TEMPLATES = {
+    "v": [
+        "The company decided to {word} in order to improve overall performance.",
+        "Management plans to {word} before the end of the fiscal year.",
+        "It is important to {word} when dealing with complex business situations.",
+        "The director asked the team to {word} as part of the new initiative.",
+        "In today's competitive market, companies must {word} to stay ahead.",
+        "The board voted to {word} the proposed changes immediately.",
+        "Employees are expected to {word} according to company guidelines.",
+        "The CEO emphasized the need to {word} during the quarterly meeting.",
+    ],
+    "n": [
+        "The {word} was discussed thoroughly during the board meeting.",
+        "Effective {word} is essential for any successful organization.",
+        "The company's {word} has improved significantly this quarter.",
+        "A detailed {word} was submitted to the management team.",
+        "The {word} will be reviewed by the committee next week.",
+        "Good {word} can lead to higher employee satisfaction.",
+        "The annual {word} showed promising results for the company.",
+        "Proper {word} is a key factor in business success.",
+    ],
+    "adj": [
+        "The {word} approach helped the company achieve its goals.",
+        "A {word} strategy is necessary for long-term success.",
+        "The manager praised the team for their {word} performance.",
+        "The {word} results exceeded everyone's expectations.",
+        "It is {word} to maintain high standards in the workplace.",
+        "The company adopted a more {word} policy this year.",
+        "The {word} solution resolved the issue quickly and efficiently.",
+        "Investors were pleased with the {word} outcome of the project.",
+    ],
+    "adv": [
+        "The project was {word} completed ahead of schedule.",
+        "The team worked {word} to meet the tight deadline.",
+        "Sales have {word} increased over the past quarter.",
+        "The policy was {word} enforced across all departments.",
+    ],
+}
+
+# Chinese translations for TEMPLATES, index-aligned
+TEMPLATES_ZH = {
+    "v": [
+        "公司決定{word}以提升整體績效。",
+        "管理層計劃在本財年結束前{word}。",
+        "在處理複雜的商業情況時，{word}是很重要的。",
+        "主管要求團隊{word}作為新計畫的一部分。",
+        "在當今競爭激烈的市場中，公司必須{word}才能保持領先。",
+        "董事會投票決定立即{word}提議的變更。",
+        "員工應按照公司準則{word}。",
+        "執行長在季度會議上強調需要{word}。",
+    ],
+    "n": [
+        "在董事會會議上徹底討論了{word}。",
+        "有效的{word}對任何成功的組織都至關重要。",
+        "公司的{word}在本季度有顯著改善。",
+        "向管理團隊提交了詳細的{word}。",
+        "{word}將在下週由委員會審查。",
+        "良好的{word}可以提高員工滿意度。",
+        "年度{word}顯示公司前景看好。",
+        "適當的{word}是商業成功的關鍵因素。",
+    ],
+    "adj": [
+        "{word}的方法幫助公司實現了目標。",
+        "{word}的策略對長期成功是必要的。",
+        "經理稱讚團隊{word}的表現。",
+        "{word}的結果超出了所有人的預期。",
+        "在工作場所保持高標準是{word}的。",
+        "公司今年採用了更{word}的政策。",
+        "{word}的解決方案快速有效地解決了問題。",
+        "投資者對專案{word}的結果感到滿意。",
+    ],
+    "adv": [
+        "專案{word}提前完成。",
+        "團隊{word}工作以滿足緊迫的期限。",
+        "銷售額在過去一季{word}增長。",
+        "該政策在所有部門{word}執行。",
+    ],
+}
+
+# Second set of sentence templates for generating two sentences per word
+TEMPLATES_2 = {
+    "v": [
+        "The department needs to {word} the new policy before the deadline.",
+        "We should {word} every opportunity to expand our market share.",
+        "The supervisor asked the staff to {word} the updated procedures.",
+        "It would be beneficial to {word} this matter with the client directly.",
+        "The organization plans to {word} several key objectives this quarter.",
+        "Senior management decided to {word} a new approach to the problem.",
+        "All departments are required to {word} in accordance with regulations.",
+        "The consultant recommended that we {word} our current strategy.",
+    ],
+    "n": [
+        "The {word} played a crucial role in the company's recent success.",
+        "A comprehensive {word} was presented at the annual shareholders meeting.",
+        "The importance of {word} cannot be overstated in modern business.",
+        "The team prepared a detailed {word} for the upcoming presentation.",
+        "Understanding {word} is essential for career advancement.",
+        "The recent {word} has had a significant impact on our operations.",
+        "Effective {word} requires careful planning and consistent execution.",
+        "The committee reviewed the {word} and approved it unanimously.",
+    ],
+    "adj": [
+        "The {word} decision led to a significant increase in revenue.",
+        "Maintaining a {word} attitude is important for professional growth.",
+        "The report highlighted several {word} factors affecting productivity.",
+        "A {word} perspective can help resolve complex workplace issues.",
+        "The survey revealed that employees prefer a {word} work environment.",
+        "The {word} proposal received strong support from all stakeholders.",
+        "Developing a {word} mindset is crucial for effective leadership.",
+        "The company's {word} reputation attracted top talent from around the world.",
+    ],
+    "adv": [
+        "The new system was {word} implemented across all departments.",
+        "Revenue has {word} grown since the restructuring took effect.",
+        "The guidelines were {word} followed by all team members.",
+        "Customer feedback was {word} positive regarding the new service.",
+    ],
+}
+
+# Chinese translations for TEMPLATES_2, index-aligned
+TEMPLATES_2_ZH = {
+    "v": [
+        "部門需要在截止日期前{word}新政策。",
+        "我們應該{word}每個機會來擴大市場份額。",
+        "主管要求員工{word}更新的程序。",
+        "直接與客戶{word}這件事會很有幫助。",
+        "組織計劃本季度{word}幾個關鍵目標。",
+        "高層管理決定{word}新方法來解決問題。",
+        "所有部門都必須按照規定{word}。",
+        "顧問建議我們{word}目前的策略。",
+    ],
+    "n": [
+        "{word}在公司最近的成功中發揮了關鍵作用。",
+        "在年度股東大會上提出了全面的{word}。",
+        "{word}在現代商業中的重要性不容小覷。",
+        "團隊為即將到來的簡報準備了詳細的{word}。",
+        "理解{word}對職業發展至關重要。",
+        "最近的{word}對我們的營運產生了重大影響。",
+        "有效的{word}需要仔細規劃和持續執行。",
+        "委員會審查了{word}並一致通過。",
+    ],
+    "adj": [
+        "{word}的決定導致收入大幅增加。",
+        "保持{word}的態度對專業成長很重要。",
+        "報告強調了影響生產力的幾個{word}因素。",
+        "{word}的觀點可以幫助解決複雜的職場問題。",
+        "調查顯示員工更喜歡{word}的工作環境。",
+        "{word}的提案獲得了所有利益相關者的大力支持。",
+        "培養{word}的心態對有效領導至關重要。",
+        "公司{word}的聲譽吸引了來自世界各地的頂尖人才。",
+    ],
+    "adv": [
+        "新系統在所有部門{word}實施。",
+        "自重組生效以來，收入{word}增長。",
+        "所有團隊成員{word}遵守了準則。",
+        "客戶對新服務的反饋{word}是正面的。",
+    ],
+}
+
+# Cloze question templates built around a word's collocation: (en with {col}, zh with {zh_col})
+QUESTION_TEMPLATES = {
+    "v": [
+        ("The manager decided to {col}.", "經理決定{zh_col}。"),
+        ("It is important to {col} carefully.", "謹慎地{zh_col}是很重要的。"),
+        ("They plan to {col} next week.", "他們計劃下週{zh_col}。"),
+        ("We need to {col} to improve efficiency.", "我們需要{zh_col}以提高效率。"),
+        ("Please {col} as soon as possible.", "請儘快{zh_col}。"),
+        ("The team worked hard to {col}.", "團隊努力{zh_col}。"),
+    ],
+    "n": [
+        ("The {col} was discussed in the meeting.", "會議中討論了{zh_col}。"),
+        ("We need to analyze the {col}.", "我們需要分析{zh_col}。"),
+        ("This report focuses on {col}.", "這份報告著重於{zh_col}。"),
+        ("Effective {col} is crucial for success.", "有效的{zh_col}對成功至關重要。"),
+        ("They requested more information about the {col}.", "他們要求更多關於{zh_col}的資訊。"),
+    ],
+    "adj": [
+        ("The result was a {col}.", "結果是一個{zh_col}。"),
+        ("They are looking for a {col} solution.", "他們正在尋找一個{zh_col}的解決方案。"),
+        ("Specifically, the {col} caused a delay.", "具體來說，{zh_col}導致了延誤。"),
+        ("It is considered a {col} approach.", "這被認為是一種{zh_col}的方法。"),
+    ],
+    "adv": [
+        ("The process {col}.", "這個過程{zh_col}。"),
+        ("She {col} completed the task.", "她{zh_col}完成了任務。"),
+        ("Sales figures {col} increased.", "銷售數字{zh_col}增長。"),
+    ],
+}
+
+# Generic question sentences when the collocation is unusable: (en with {word}, zh with {meaning})
+QUESTION_FALLBACK = {
+    "v": ("The company decided to {word}.", "公司決定{meaning}。"),
+    "n": ("The {word} allows for better management.", "這個{meaning}允許更好的管理。"),
+    "adj": ("The strategy was {word} and effective.", "這個策略是{meaning}且有效的。"),
+    "adv": ("Please proceed {word}.", "請{meaning}進行。"),
+}
+
+# Grammar hint per POS for question explanations
+GRAMMAR_HINTS = {
+    "v": "此處需要填入動詞，以完成句子的動作描述。",
+    "n": "此處需要名詞，通常作為句子的主詞或受詞。",
+    "adj": "此處需要形容詞，用來修飾後面的名詞或作為補語。",
+    "adv": "此處需要副詞，用來修飾動詞、形容詞或整句。",
+}
+DEFAULT_GRAMMAR_HINT = "請選擇最適合上下文的單字。"
+
+def _paired(en, zh):
+    return {pos: list(zip(en[pos], zh[pos])) for pos in en}
+
+# Compiled registry, built once at import
+SENTENCE_BANK = TemplateBank(_paired(TEMPLATES, TEMPLATES_ZH))
+SENTENCE_BANK_2 = TemplateBank(_paired(TEMPLATES_2, TEMPLATES_2_ZH))
+# (en, zh) pairs in id order, for the template-encoded sentence output
+SENTENCE_TEMPLATE_TABLE = SENTENCE_BANK.table + SENTENCE_BANK_2.table
+QUESTION_BANK = {pos: [(Template(en), Template(zh)) for en, zh in templates]
+                 for pos, templates in QUESTION_TEMPLATES.items()}
+QUESTION_FALLBACK_BANK = {pos: (Template(en), Template(zh)) for pos, (en, zh) in QUESTION_FALLBACK.items()}
@@ -0,0 +1,45 @@
+"""WordEntry record - the interned row type shared by every word module"""
+import sys
+from collections import namedtuple
+
+class WordEntry(namedtuple("WordEntry", ["word", "pos", "meanings_zh", "collocation", "difficulty"])):
+    """A (word, pos, meanings_zh, collocation, difficulty) row.
+
+    Still a tuple, so existing code indexing w[0]..w[4] keeps working, but
+    slotted (no per-instance __dict__) and built with interned strings so
+    identical glosses and POS tags across modules share one object.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def intern(cls, row, strings=None, owned=False):
+        """Build an entry from a raw 5-tuple, interning its word, POS, gloss and collocation strings
+
+        strings is the intern table, a dict mapping each string to its shared
+        copy; without one the strings go through sys.intern. With owned=True
+        the caller owns the row, so its meanings list is interned in place.
+        """
+        share = sys.intern if strings is None else (lambda s: strings.setdefault(s, s))
+        word, pos, meanings, collocation, difficulty = row
+        if isinstance(meanings, list):
+            if owned:
+                meanings[:] = [share(m) for m in meanings]
+            else:
+                meanings = [share(m) for m in meanings]
+        else:
+            meanings = share(meanings)
+        return cls(share(word), share(pos), meanings, share(collocation), difficulty)
+
+def intern_words(words, strings=None, owned=False):
+    """Convert a {cat_id: [raw tuples]} mapping into {cat_id: [WordEntry]}
+
+    With owned=True the lists are converted in place, each raw tuple replaced
+    (and freed) as soon as its entry exists, so the raw and converted rows of a
+    module are never all alive at once. Only pass rows nobody else can see.
+    """
+    if not owned:
+        return {cat_id: [WordEntry.intern(row, strings) for row in rows] for cat_id, rows in words.items()}
+    for rows in words.values():
+        for i, row in enumerate(rows):
+            rows[i] = WordEntry.intern(row, strings, owned=True)
+    return words
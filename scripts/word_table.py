@@ -0,0 +1,157 @@
+"""Columnar word table - array-backed storage for the merged word bank"""
+import sys
+from array import array
+from itertools import compress
+
+class WordTable:
+    """Column store for (word, pos, meanings_zh, collocation, difficulty) rows.
+
+    Words are interned strings, category/POS/difficulty are uint8 columns
+    and meanings/collocations live in offset-indexed string pools. Rows are
+    materialized as the same 5-tuples the generators already consume.
+    """
+
+    def __init__(self):
+        self.categories = []          # category index -> cat_id
+        self.pos_tags = []            # POS index -> tag
+        self.words = []
+        self.category = array("B")
+        self.pos = array("B")
+        self.difficulty = array("B")
+        self.meaning_pool = []        # meaning id -> interned gloss
+        self.meaning_ids = array("I")
+        self.meaning_offsets = array("I", [0])
+        self.collocation_pool = ""
+        self.collocation_offsets = array("I", [0])
+        self.primary_category = {}    # word -> primary cat_id, for words in several categories
+        self.alias_categories = {}    # word -> other cat_ids listing it as an alias
+        self.derived_from = {}        # auto-derived word -> (base word, rule id)
+        self._meaning_index = {}
+        self._word_rows = None
+
+    @classmethod
+    def from_words(cls, word_bank, primary_category=None, alias_categories=None, derived_from=None):
+        """Build a table from a {cat_id: [word tuples]} mapping, keeping category order"""
+        table = cls()
+        table.primary_category = dict(primary_category or {})
+        table.alias_categories = dict(alias_categories or {})
+        table.derived_from = dict(derived_from or {})
+        collocations = []
+        colloc_end = 0
+        for cat_id, cat_words in word_bank.items():
+            cat_idx = table._code(table.categories, cat_id)
+            for word, pos, meanings, collocation, difficulty in cat_words:
+                table.words.append(sys.intern(word))
+                table.category.append(cat_idx)
+                table.pos.append(table._code(table.pos_tags, pos))
+                table.difficulty.append(difficulty)
+                for meaning in meanings if isinstance(meanings, list) else [meanings]:
+                    table.meaning_ids.append(table._meaning_id(meaning))
+                table.meaning_offsets.append(len(table.meaning_ids))
+                collocations.append(collocation)
+                colloc_end += len(collocation)
+                table.collocation_offsets.append(colloc_end)
+        table.collocation_pool = "".join(collocations)
+        table._meaning_index = {}
+        return table
+
+    @staticmethod
+    def _code(values, value):
+        if value not in values:
+            if len(values) >= 256:
+                raise ValueError(f"too many distinct values for a uint8 column: {value!r}")
+            values.append(value)
+        return values.index(value)
+
+    def _meaning_id(self, meaning):
+        meaning_id = self._meaning_index.get(meaning)
+        if meaning_id is None:
+            meaning_id = len(self.meaning_pool)
+            self._meaning_index[meaning] = meaning_id
+            self.meaning_pool.append(sys.intern(meaning))
+        return meaning_id
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_meaning_index", None)
+        state.pop("_word_rows", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._meaning_index = {}
+        self._word_rows = None
+
+    def find(self, word):
+        """Row indices holding word, across all categories (hash lookup)"""
+        if self._word_rows is None:
+            self._word_rows = {}
+            for i, w in enumerate(self.words):
+                self._word_rows.setdefault(w, []).append(i)
+        return self._word_rows.get(word, [])
+
+    def categories_of(self, word):
+        """Every cat_id listing word, primary category first, aliases included"""
+        cat_ids = [self.categories[self.category[i]] for i in self.find(word)]
+        return cat_ids + [c for c in self.alias_categories.get(word, []) if c not in cat_ids]
+
+    def meanings(self, i):
+        ids = self.meaning_ids[self.meaning_offsets[i]:self.meaning_offsets[i + 1]]
+        return [self.meaning_pool[m] for m in ids]
+
+    def collocation(self, i):
+        return self.collocation_pool[self.collocation_offsets[i]:self.collocation_offsets[i + 1]]
+
+    def row(self, i):
+        """Materialize row i as a (word, pos, meanings_zh, collocation, difficulty) tuple"""
+        return (
+            self.words[i],
+            self.pos_tags[self.pos[i]],
+            self.meanings(i),
+            self.collocation(i),
+            self.difficulty[i],
+        )
+
+    def rows(self, indices):
+        return [self.row(i) for i in indices]
+
+    def _mask(self, column, values, lookup=None):
+        """Return a bitmask (as int) of rows whose column value is in values"""
+        table = bytearray(256)
+        for value in values:
+            code = value if lookup is None else (lookup.index(value) if value in lookup else None)
+            if code is not None:
+                table[code] = 1
+        return int.from_bytes(column.tobytes().translate(table), "big")
+
+    def select(self, category=None, pos=None, difficulty=None):
+        """Return the row indices matching every given filter.
+
+        Each filter takes a single value or a collection of values. Matching is
+        done column-wide with bytes.translate and integer bitmasks, so no
+        per-row Python comparisons are executed.
+        """
+        n = len(self.words)
+        mask = (1 << (8 * n)) - 1 if n else 0
+        for column, values, lookup in (
+            (self.category, category, self.categories),
+            (self.pos, pos, self.pos_tags),
+            (self.difficulty, difficulty, None),
+        ):
+            if values is None:
+                continue
+            if isinstance(values, (str, int)):
+                values = [values]
+            mask &= self._mask(column, values, lookup)
+        return list(compress(range(n), mask.to_bytes(n, "big")))
+
+    def words_in(self, cat_id):
+        """Words of one category in insertion order"""
+        return [self.words[i] for i in self.select(category=cat_id)]
+
+    def category_rows(self, cat_id):
+        """Rows of one category in insertion order, as generator-ready tuples"""
+        return self.rows(self.select(category=cat_id))
@@ -1,44 +1,4 @@
-"""Programmatic word derivation engine - generates word forms systematically"""
-
-# Common suffixes and their transformations
-# (input_suffix, output_suffix, from_pos, to_pos)
-SUFFIX_RULES = [
-    # Verb -> Noun (action/result)
-    ("ate", "ation", "v", "n"),
-    ("ize", "ization", "v", "n"),
-    ("ify", "ification", "v", "n"),
-    ("e", "ation", "v", "n"),
-    ("", "ment", "v", "n"),
-    ("", "ance", "v", "n"),
-    ("", "ence", "v", "n"),
-    ("e", "ing", "v", "n"),
-    ("", "ing", "v", "n"),
-    # Verb -> Agent noun
-    ("e", "or", "v", "n"),
-    ("e", "er", "v", "n"),
-    ("", "er", "v", "n"),
-    # Verb -> Adjective
-    ("e", "able", "v", "adj"),
-    ("", "able", "v", "adj"),
-    ("e", "ive", "v", "adj"),
-    ("", "ive", "v", "adj"),
-    ("", "ed", "v", "adj"),
-    # Noun -> Adjective
-    ("", "al", "n", "adj"),
-    ("y", "ical", "n", "adj"),
-    ("", "ous", "n", "adj"),
-    ("", "ful", "n", "adj"),
-    ("", "less", "n", "adj"),
-    ("", "ive", "n", "adj"),
-    # Adjective -> Adverb
-    ("", "ly", "adj", "adv"),
-    ("le", "ly", "adj", "adv"),
-    ("ic", "ically", "adj", "adv"),
-    # Adjective -> Noun
-    ("", "ness", "adj", "n"),
-    ("t", "ce", "adj", "n"),
-    ("", "ity", "adj", "n"),
-]
+"""Curated derived word forms - Categories 02-05 (rules live in derivation.py)"""
 
 # Known valid English derived forms organized by category
 # These are manually curated to ensure quality
@@ -1,29 +1,4 @@
 """Word family expansion - generate related forms for each base word to reach 10000+"""
-import random
-
-# Suffix rules: (suffix_to_add, resulting_pos, meaning_suffix_zh)
-DERIVATION_RULES = {
-    "v": [
-        ("-tion", "n", "的行為/過程"),
-        ("-ment", "n", "的行為/結果"),
-        ("-er", "n", "的人/物"),
-        ("-able", "adj", "可...的"),
-        ("-ive", "adj", "有...傾向的"),
-        ("-ly", "adv", "地"),
-    ],
-    "n": [
-        ("-al", "adj", "...的"),
-        ("-ous", "adj", "充滿...的"),
-        ("-ful", "adj", "充滿...的"),
-        ("-less", "adj", "缺乏...的"),
-    ],
-    "adj": [
-        ("-ly", "adv", "地"),
-        ("-ness", "n", "...的狀態"),
-        ("-ity", "n", "...的性質"),
-    ],
-}
-
 # Additional high-frequency TOEIC words organized by category for maximum coverage
 WORDS_EXPAND = {
 "cat01": [
@@ -1,33 +1,4 @@
-"""Programmatic word family generator - creates derived forms from base words"""
-
-# Rules: (ending_to_remove, ending_to_add, new_pos, meaning_prefix_zh)
-DERIVATION_MAP = [
-    # Verb -> Noun
-    ("e", "ation", "v", "n", "...的行為"),
-    ("", "tion", "v", "n", "...的行為"),
-    ("", "ment", "v", "n", "...的結果"),
-    ("e", "or", "v", "n", "...的人"),
-    ("", "er", "v", "n", "...的人"),
-    ("e", "ance", "v", "n", "...的狀態"),
-    ("", "ance", "v", "n", "...的狀態"),
-    # Verb -> Adj
-    ("e", "able", "v", "adj", "可...的"),
-    ("", "able", "v", "adj", "可...的"),
-    ("e", "ive", "v", "adj", "...的"),
-    ("", "ive", "v", "adj", "...的"),
-    # Noun -> Adj
-    ("y", "ical", "n", "adj", "...的"),
-    ("", "al", "n", "adj", "...的"),
-    ("", "ous", "n", "adj", "充滿...的"),
-    ("", "ful", "n", "adj", "充滿...的"),
-    ("", "less", "n", "adj", "缺少...的"),
-    # Adj -> Adv
-    ("", "ly", "adj", "adv", "...地"),
-    # Adj -> Noun
-    ("t", "ce", "adj", "n", "...的狀態"),
-    ("", "ness", "adj", "n", "...的特質"),
-    ("le", "ility", "adj", "n", "...的特質"),
-]
+"""High-frequency TOEIC word families - Category 01 derived forms (rules live in derivation.py)"""
 
 # Common English word families that are high-frequency in TOEIC
 # Each entry: (base_word, derivatives_list)
@@ -5,6 +5,22 @@ import PetDisplay from './components/PetDisplay'
 import ShopModal from './components/ShopModal'
 import AnimatedPet from './components/AnimatedPet'
 import TamagotchiDisplay from './components/TamagotchiDisplay'
+import { expandSentence } from './sentence_templates'
+import { formatExplanation } from './explanations'
+
+// Family lookup over the adjacency arrays of word_families.json: one Map probe plus one slice
+const buildFamilyLookup = (graph) => {
+    if (!graph) return () => []
+    const node = new Map(graph.words.map((word, i) => [word, i]))
+    return (word) => {
+        const i = node.get(word)
+        if (i === undefined) return []
+        const f = graph.family[i]
+        return graph.family_members
+            .slice(graph.family_offsets[f], graph.family_offsets[f + 1])
+            .map(m => graph.words[m])
+    }
+}
 
 function App() {
     // Existing state
@@ -48,18 +64,24 @@ function App() {
             fetch('./data/toeic_listening.json').then(res => res.json()),
             fetch('./data/toeic_grammar.json').then(res => res.json()),
             fetch('./data/toeic_reading.json').then(res => res.json()),
-            fetch('./data/shop_data.json').then(res => res.json())
+            fetch('./data/shop_data.json').then(res => res.json()),
+            // Optional: older builds do not export the word-family graph
+            fetch('./data/word_families.json').then(res => res.ok ? res.json() : null).catch(() => null)
         ])
-            .then(([vocabData, listenData, gramData, readData, shopData]) => {
+            .then(([vocabData, listenData, gramData, readData, shopData, familyData]) => {
                 // Pre-index sentences for performance
+                const vocabById = {};
+                vocabData.vocab_items.forEach(item => { vocabById[item.id] = item });
                 const sentencesByVocab = {};
                 (vocabData.sentences || []).forEach(s => {
                     if (!sentencesByVocab[s.vocab_id]) sentencesByVocab[s.vocab_id] = [];
-                    sentencesByVocab[s.vocab_id].push({
-                        id: s.id,
-                        sentence_en: s.sentence_en,
-                        sentence_zh: s.sentence_zh
-                    });
+                    sentencesByVocab[s.vocab_id].push(expandSentence(s, vocabData.sentence_templates, vocabById[s.vocab_id]));
+                });
+
+                const questionsByVocab = {};
+                (vocabData.questions || []).forEach(q => {
+                    if (!questionsByVocab[q.vocab_id]) questionsByVocab[q.vocab_id] = [];
+                    questionsByVocab[q.vocab_id].push(q);
                 });
 
                 // Normalize vocabData (toeic_part1.json)
@@ -77,24 +99,33 @@ function App() {
                         meaning: Array.isArray(item.meaning_zh) ? item.meaning_zh.join(', ') : item.meaning_zh,
                         phonetic: item.phonetic,
                         category_id: item.category_id,
+                        // Words shared between categories are listed once, with the other categories as aliases
+                        category_ids: [item.category_id, ...(item.alias_category_ids || [])],
                         sentences: sentencesByVocab[item.id] || [],
-                        questions: (vocabData.questions || []).filter(q => q.vocab_id === item.id).map(q => ({
-                            id: q.id,
-                            vocab_id: q.vocab_id,
-                            sentence_id: q.sentence_id,
-                            type: q.type,
-                            prompt_en: q.prompt_en,
-                            prompt_zh: q.prompt_zh,
-                            full_sentence: q.full_sentence,
-                            choices: q.choices,
-                            answer_index: q.answer_index,
-                            explanation: q.explanation_zh,
-                            level: q.level || 'easy',
-                            topic: q.topic,
-                            word: q.word,
-                            meaning: q.meaning
-                        }))
-                    }))
+                        questions: (questionsByVocab[item.id] || []).map(q => {
+                            let explanation
+                            return {
+                                id: q.id,
+                                vocab_id: q.vocab_id,
+                                sentence_id: q.sentence_id,
+                                type: q.type,
+                                prompt_en: q.prompt_en,
+                                prompt_zh: q.prompt_zh,
+                                full_sentence: q.full_sentence,
+                                choices: q.choices,
+                                answer_index: q.answer_index,
+                                // Formatted from the structured fields when first shown
+                                get explanation() {
+                                    return explanation ?? (explanation = formatExplanation(q, vocabById, vocabData.grammar_hints))
+                                },
+                                level: q.level || 'easy',
+                                topic: q.topic,
+                                word: q.word,
+                                meaning: q.meaning
+                            }
+                        })
+                    })),
+                    familyOf: buildFamilyLookup(familyData)
                 }
                 setData(normalizedVocab)
 
@@ -372,7 +403,7 @@ function App() {
             )
         } else if (categoryId) {
             const category = data.categories.find(c => c.id === categoryId)
-            const vocabList = data.vocabulary.filter(v => v.category_id === categoryId)
+            const vocabList = data.vocabulary.filter(v => v.category_ids.includes(categoryId))
             questions = vocabList.flatMap(vocab => vocab.questions)
         } else {
             questions = data.vocabulary.flatMap(vocab => vocab.questions)
@@ -382,7 +413,7 @@ function App() {
     }
 
     const startStudy = (categoryId) => {
-        const vocabList = data.vocabulary.filter(v => v.category_id === categoryId)
+        const vocabList = data.vocabulary.filter(v => v.category_ids.includes(categoryId))
         setCategoryVocabs(vocabList)
         setCurrentVocabIndex(0)
         setSelectedCategory(categoryId)
@@ -855,6 +886,16 @@ function App() {
                                         <span className="part-of-speech-tag">{selectedWord.part_of_speech}</span>
                                         <span className="meaning-text-panel">{selectedWord.meaning}</span>
                                     </div>
+                                    {data.familyOf(selectedWord.word).length > 1 && (
+                                        <div className="panel-family">
+                                            <h3 className="panel-subtitle">🌳 詞族</h3>
+                                            <div className="family-words">
+                                                {data.familyOf(selectedWord.word).map(w => (
+                                                    <span key={w} className={w === selectedWord.word ? 'family-word current' : 'family-word'}>{w}</span>
+                                                ))}
+                                            </div>
+                                        </div>
+                                    )}
                                     <div className="panel-sentences">
                                         <h3 className="panel-subtitle">📚 例句</h3>
                                         {selectedWord.sentences && selectedWord.sentences.map((s, i) => (
@@ -947,7 +988,7 @@ function App() {
                     </header>
                     <div className="categories">
                         {data.categories.map(category => {
-                            const vocabCount = data.vocabulary.filter(v => v.category_id === category.id).length
+                            const vocabCount = data.vocabulary.filter(v => v.category_ids.includes(category.id)).length
                             return (
                                 <div
                                     key={category.id}
@@ -977,7 +1018,7 @@ function App() {
                             <p>測試所有單字</p>
                         </div>
                         {data.categories.map(category => {
-                            const vocabCount = data.vocabulary.filter(v => v.category_id === category.id).length
+                            const vocabCount = data.vocabulary.filter(v => v.category_ids.includes(category.id)).length
                             return (
                                 <div
                                     key={category.id}
@@ -0,0 +1,25 @@
+// Vocabulary questions carry a structured explanation instead of prebuilt
+// explanation_zh text: a grammar_hint id into the dataset's grammar_hints table
+// and, per choice, the id of the vocab item whose meanings it is analysed with.
+// The text matches generate_vocab.format_explanation.
+
+const meaningText = (meanings) => Array.isArray(meanings) ? meanings.join('、') : meanings
+
+export function formatExplanation(question, vocabById, hints) {
+    const fields = question.explanation
+    if (!fields) return question.explanation_zh
+    const pos = vocabById[question.vocab_id]?.pos
+    const lines = question.choices.map((choice, i) => {
+        const item = vocabById[fields.choice_vocab_ids[i]]
+        const marker = choice === question.word ? '✅' : '❌'
+        return `${marker} ${choice} (${pos}): ${item ? meaningText(item.meaning_zh) : ''}`
+    })
+    return `Correct Answer: ${question.word}\n` +
+        `Meaning: ${question.meaning}\n\n` +
+        `【Parsing】\n` +
+        `Sentence: ${question.full_sentence}\n` +
+        `Translation: ${question.prompt_zh}\n` +
+        `💡 Grammar Hint: ${(hints || {})[fields.grammar_hint]}\n\n` +
+        `【Options Analysis】\n` +
+        lines.join('\n')
+}
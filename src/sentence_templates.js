@@ -0,0 +1,24 @@
+// Template-encoded sentences (generate_vocab.py --sentence-encoding templates)
+// store a template id instead of sentence_en / sentence_zh. Each template is a
+// [before, after] literal pair around one slot; slots defaults to the vocab
+// item's word and first meaning.
+
+const defaultSlots = (vocabItem) => [
+    vocabItem.word,
+    Array.isArray(vocabItem.meaning_zh) ? vocabItem.meaning_zh[0] : vocabItem.meaning_zh
+]
+
+// Returns { id, sentence_en, sentence_zh }; encoded text is only built when first read
+export function expandSentence(sentence, templates, vocabItem) {
+    if (sentence.template === undefined || !templates) {
+        return { id: sentence.id, sentence_en: sentence.sentence_en, sentence_zh: sentence.sentence_zh }
+    }
+    const template = templates[sentence.template]
+    const slots = sentence.slots || defaultSlots(vocabItem)
+    let en, zh
+    return {
+        id: sentence.id,
+        get sentence_en() { return en ?? (en = template.en.join(slots[0])) },
+        get sentence_zh() { return zh ?? (zh = template.zh.join(slots[1])) }
+    }
+}